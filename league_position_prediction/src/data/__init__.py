@@ -6,6 +6,7 @@ from .loader import (
     load_fixture_csv,
     load_match_statistics,
     normalize_team_names,
+    to_team_categories,
     prepare_match_statistics,
     load_and_process_league_data,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "load_fixture_csv",
     "load_match_statistics",
     "normalize_team_names",
+    "to_team_categories",
     "prepare_match_statistics",
     "load_and_process_league_data",
 ]
@@ -8,10 +8,53 @@ This module provides functions to load and preprocess match data from:
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 
-def load_fixture_csv(filepath: str) -> pd.DataFrame:
+# Columns (by config key) that hold text, so the parser doesn't have to infer them
+TEXT_COLUMN_KEYS = ("date", "home_team", "away_team", "result")
+
+
+def _read_csv(
+    filepath: str,
+    usecols: Optional[Iterable[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    chunksize: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Read a CSV file, optionally restricted to some columns and in chunks.
+
+    Columns listed in usecols that are missing from the file are ignored.
+    """
+    if usecols is not None:
+        # A callable lets read_csv skip wanted columns missing from the file
+        usecols = set(usecols).__contains__
+
+    if chunksize is None:
+        return pd.read_csv(filepath, usecols=usecols, dtype=dtype)
+
+    chunks = pd.read_csv(filepath, usecols=usecols, dtype=dtype, chunksize=chunksize)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _config_read_options(cols_config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Build usecols/dtype options for _read_csv from a config column mapping.
+    """
+    return {
+        "usecols": list(cols_config.values()),
+        "dtype": {
+            cols_config[key]: str for key in TEXT_COLUMN_KEYS if key in cols_config
+        },
+    }
+
+
+def load_fixture_csv(
+    filepath: str,
+    usecols: Optional[Iterable[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    chunksize: Optional[int] = None,
+) -> pd.DataFrame:
     """
     Load fixture data from CSV file.
 
@@ -20,15 +63,23 @@ def load_fixture_csv(filepath: str) -> pd.DataFrame:
 
     Args:
         filepath: Path to the CSV file
+        usecols: Columns to read (optional, defaults to all columns)
+        dtype: Column dtypes, skips type inference for these columns (optional)
+        chunksize: Read the file in chunks of this many rows (optional)
 
     Returns:
         DataFrame with fixture data
     """
-    df = pd.read_csv(filepath)
+    df = _read_csv(filepath, usecols=usecols, dtype=dtype, chunksize=chunksize)
     return df
 
 
-def load_match_statistics(filepath: str) -> pd.DataFrame:
+def load_match_statistics(
+    filepath: str,
+    usecols: Optional[Iterable[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    chunksize: Optional[int] = None,
+) -> pd.DataFrame:
     """
     Load match statistics from CSV file (football-data.co.uk format).
 
@@ -37,11 +88,14 @@ def load_match_statistics(filepath: str) -> pd.DataFrame:
 
     Args:
         filepath: Path to the CSV file
+        usecols: Columns to read (optional, defaults to all columns)
+        dtype: Column dtypes, skips type inference for these columns (optional)
+        chunksize: Read the file in chunks of this many rows (optional)
 
     Returns:
         DataFrame with match statistics
     """
-    df = pd.read_csv(filepath)
+    df = _read_csv(filepath, usecols=usecols, dtype=dtype, chunksize=chunksize)
     return df
 
 
@@ -63,14 +117,46 @@ def normalize_team_names(
     Returns:
         DataFrame with normalized team names
     """
-    df = df.copy()
+    # map is much faster than replace for a plain 1:1 substitution,
+    # names missing from the mapping are kept as they are
+    return df.assign(
+        **{
+            col: df[col].map(team_mapping).fillna(df[col])
+            for col in (home_team_col, away_team_col)
+            if col in df.columns
+        }
+    )
+
+
+def to_team_categories(
+    df: pd.DataFrame,
+    home_team_col: str = "Home Team",
+    away_team_col: str = "Away Team",
+) -> pd.DataFrame:
+    """
+    Convert team name columns to a shared categorical dtype.
 
-    if home_team_col in df.columns:
-        df[home_team_col] = df[home_team_col].replace(team_mapping)
-    if away_team_col in df.columns:
-        df[away_team_col] = df[away_team_col].replace(team_mapping)
+    Both columns use the same sorted categories, so team names are stored
+    as integer codes and compare/group without string hashing.
 
-    return df
+    Args:
+        df: Input DataFrame
+        home_team_col: Name of home team column
+        away_team_col: Name of away team column
+
+    Returns:
+        DataFrame with categorical team name columns
+    """
+    team_cols = [col for col in (home_team_col, away_team_col) if col in df.columns]
+    if not team_cols:
+        return df
+
+    teams = set()
+    for col in team_cols:
+        teams.update(df[col].dropna())
+    team_dtype = pd.CategoricalDtype(sorted(teams))
+
+    return df.assign(**{col: df[col].astype(team_dtype) for col in team_cols})
 
 
 def prepare_match_statistics(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
@@ -79,7 +165,7 @@ def prepare_match_statistics(df: pd.DataFrame, config: Dict[str, Any]) -> pd.Dat
 
     - Selects only necessary columns
     - Renames columns for consistency
-    - Normalizes team names
+    - Normalizes team names (stored as categorical)
     - Converts result column to appropriate format
 
     Args:
@@ -89,8 +175,6 @@ def prepare_match_statistics(df: pd.DataFrame, config: Dict[str, Any]) -> pd.Dat
     Returns:
         Prepared DataFrame with standardized column names
     """
-    df = df.copy()
-
     cols_config = config["columns"]["match_stats"]
 
     # Select and rename columns
@@ -110,12 +194,13 @@ def prepare_match_statistics(df: pd.DataFrame, config: Dict[str, Any]) -> pd.Dat
     # Only select columns that exist in the DataFrame
     columns_to_select = {k: v for k, v in columns_to_select.items() if k in df.columns}
 
-    df = df[list(columns_to_select.keys())].rename(columns=columns_to_select)
-
-    # Normalize team names
-    df = normalize_team_names(df, config["team_name_mapping"])
-
-    return df
+    # Select, rename and normalize team names in one chain (no intermediate copies)
+    return (
+        df[list(columns_to_select.keys())]
+        .rename(columns=columns_to_select)
+        .pipe(normalize_team_names, config["team_name_mapping"])
+        .pipe(to_team_categories)
+    )
 
 
 def prepare_fixtures(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
@@ -129,8 +214,6 @@ def prepare_fixtures(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
     Returns:
         Prepared DataFrame with standardized column names
     """
-    df = df.copy()
-
     cols_config = config["columns"]["all_matches"]
 
     # Select and rename columns
@@ -144,23 +227,27 @@ def prepare_fixtures(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
     # Only select columns that exist
     columns_to_select = {k: v for k, v in columns_to_select.items() if k in df.columns}
 
-    df = df[list(columns_to_select.keys())].rename(columns=columns_to_select)
-
-    # Normalize team names
-    df = normalize_team_names(df, config["team_name_mapping"])
-
-    return df
+    # Select, rename and normalize team names in one chain (no intermediate copies)
+    return (
+        df[list(columns_to_select.keys())]
+        .rename(columns=columns_to_select)
+        .pipe(normalize_team_names, config["team_name_mapping"])
+        .pipe(to_team_categories)
+    )
 
 
 def load_and_process_league_data(
-    config: Dict[str, Any], data_dir: str = "data/raw"
+    config: Dict[str, Any], data_dir: str = "data/raw", chunksize: Optional[int] = None
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Load and process all league data from configured sources.
 
+    Only the columns named in the configuration are read from the files.
+
     Args:
         config: Configuration dictionary
         data_dir: Base directory containing raw data files
+        chunksize: Read the files in chunks of this many rows (optional)
 
     Returns:
         Tuple of (fixtures DataFrame, statistics DataFrame)
@@ -169,12 +256,18 @@ def load_and_process_league_data(
 
     # Load fixtures
     fixtures_file = data_path / config["data_sources"]["all_matches"]["filename"]
-    fixtures = load_fixture_csv(str(fixtures_file))
-    fixtures = prepare_fixtures(fixtures, config)
+    fixtures = load_fixture_csv(
+        str(fixtures_file),
+        chunksize=chunksize,
+        **_config_read_options(config["columns"]["all_matches"]),
+    ).pipe(prepare_fixtures, config)
 
     # Load match statistics
     stats_file = data_path / config["data_sources"]["match_statistics"]["filename"]
-    statistics = load_match_statistics(str(stats_file))
-    statistics = prepare_match_statistics(statistics, config)
+    statistics = load_match_statistics(
+        str(stats_file),
+        chunksize=chunksize,
+        **_config_read_options(config["columns"]["match_stats"]),
+    ).pipe(prepare_match_statistics, config)
 
     return fixtures, statistics
@@ -2,19 +2,38 @@
 Modelling module for match simulation and prediction
 """
 
-from .poisson import simulate_match, calculate_expected_goals
+from .poisson import (
+    simulate_match,
+    simulate_matches,
+    simulate_matches_vectorized,
+    calculate_expected_goals,
+    calculate_expected_goals_vectorized,
+    calculate_expected_goals_from_codes,
+    build_stats_cache,
+    prepare_lambda_tables,
+    teams_to_codes,
+)
 from .monte_carlo import (
     simulate_season,
     monte_carlo_simulation,
     calculate_position_probabilities,
     get_team_final_position_stats,
+    SimulatedSeasonResults,
 )
 
 __all__ = [
     "simulate_match",
+    "simulate_matches",
+    "simulate_matches_vectorized",
     "calculate_expected_goals",
+    "calculate_expected_goals_vectorized",
+    "calculate_expected_goals_from_codes",
+    "build_stats_cache",
+    "prepare_lambda_tables",
+    "teams_to_codes",
     "simulate_season",
     "monte_carlo_simulation",
     "calculate_position_probabilities",
     "get_team_final_position_stats",
+    "SimulatedSeasonResults",
 ]
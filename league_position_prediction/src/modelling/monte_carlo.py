@@ -5,16 +5,53 @@ This module runs multiple simulations of the remaining season matches
 to estimate the probability distribution of final league positions.
 """
 
+import multiprocessing
+
 import numpy as np
 import pandas as pd
-from typing import Tuple, List
-
-from .poisson import simulate_match, get_match_result
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Tuple, Union
+
+from .poisson import (
+    _check_missing_statistics,
+    calculate_expected_goals_from_codes,
+    calculate_expected_goals_vectorized,
+    prepare_lambda_tables,
+    teams_to_codes,
+    simulate_matches,
+    simulate_matches_vectorized,
+    get_match_result_codes,
+    RESULT_LABELS,
+)
 from ..preprocessing.statistics import calculate_league_table
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, fall back to numpy
+    njit = None
+
+# Columns of the per-simulation league table arrays
+TABLE_COLUMNS = [
+    "Played",
+    "Wins",
+    "Draws",
+    "Losses",
+    "Goals For",
+    "Goals Against",
+    "Points",
+]
+_PLAYED, _WINS, _DRAWS, _LOSSES, _GOALS_FOR, _GOALS_AGAINST, _POINTS = range(
+    len(TABLE_COLUMNS)
+)
+
 
 def simulate_season(
-    remaining_matches: pd.DataFrame, home_stats: pd.DataFrame, away_stats: pd.DataFrame
+    remaining_matches: pd.DataFrame,
+    home_stats: pd.DataFrame,
+    away_stats: pd.DataFrame,
+    rng: Optional[np.random.Generator] = None,
 ) -> pd.DataFrame:
     """
     Simulate all remaining matches of the season.
@@ -24,34 +61,284 @@ def simulate_season(
                           Columns: "Home Team", "Away Team"
         home_stats: DataFrame with home team statistics
         away_stats: DataFrame with away team statistics
+        rng: Random number generator (optional, defaults to np.random)
 
     Returns:
         DataFrame with simulated results including columns:
         "Home Team", "Away Team", "Home Goals", "Away Goals", "Result"
     """
+    expected_home_goals, expected_away_goals = calculate_expected_goals_vectorized(
+        remaining_matches["Home Team"].to_numpy(),
+        remaining_matches["Away Team"].to_numpy(),
+        home_stats,
+        away_stats,
+    )
+
+    return _simulate_remaining_matches(
+        remaining_matches, expected_home_goals, expected_away_goals, rng
+    )
+
+
+def _simulate_remaining_matches(
+    remaining_matches: pd.DataFrame,
+    expected_home_goals: np.ndarray,
+    expected_away_goals: np.ndarray,
+    rng: Optional[np.random.Generator] = None,
+) -> pd.DataFrame:
+    """
+    Draw one set of results for the remaining matches from precomputed expected goals.
+    """
+    home_goals, away_goals = simulate_matches(
+        expected_home_goals, expected_away_goals, rng=rng
+    )
+
+    return _build_simulated_results(
+        remaining_matches,
+        home_goals,
+        away_goals,
+        get_match_result_codes(home_goals, away_goals),
+    )
+
+
+def _build_simulated_results(
+    remaining_matches: pd.DataFrame,
+    home_goals: np.ndarray,
+    away_goals: np.ndarray,
+    result_codes: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Attach one simulation's goals and results to the remaining matches.
+    """
     simulated_results = remaining_matches.copy()
 
-    # Add columns for results
-    simulated_results["Home Goals"] = 0
-    simulated_results["Away Goals"] = 0
-    simulated_results["Result"] = ""
+    simulated_results["Home Goals"] = home_goals
+    simulated_results["Away Goals"] = away_goals
+    simulated_results["Result"] = RESULT_LABELS[result_codes]
+    simulated_results["ResultCode"] = result_codes
+
+    return simulated_results
+
+
+class SimulatedSeasonResults(Sequence):
+    """
+    Full season results of each simulation, built lazily on access.
 
-    # Simulate each match
-    for index, row in simulated_results.iterrows():
-        home_team = row["Home Team"]
-        away_team = row["Away Team"]
+    Behaves like a list of DataFrames (played matches followed by that
+    simulation's results for the remaining matches), but only the simulated
+    goals are stored; the played matches are concatenated in when a season
+    is accessed instead of being copied once per simulation up front.
+    """
 
-        # Simulate match
-        home_goals, away_goals = simulate_match(
-            home_team, away_team, home_stats, away_stats
+    def __init__(
+        self,
+        played_matches: pd.DataFrame,
+        remaining_matches: pd.DataFrame,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        result_codes: np.ndarray,
+    ):
+        self.played_matches = played_matches
+        self.remaining_matches = remaining_matches
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.result_codes = result_codes
+
+    def __len__(self) -> int:
+        return len(self.home_goals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        simulated_results = _build_simulated_results(
+            self.remaining_matches,
+            self.home_goals[index],
+            self.away_goals[index],
+            self.result_codes[index],
         )
 
-        # Store results
-        simulated_results.at[index, "Home Goals"] = home_goals
-        simulated_results.at[index, "Away Goals"] = away_goals
-        simulated_results.at[index, "Result"] = get_match_result(home_goals, away_goals)
+        return pd.concat([self.played_matches, simulated_results], ignore_index=True)
 
-    return simulated_results
+
+def _accumulate_tables_numpy(
+    home_goals: np.ndarray,
+    away_goals: np.ndarray,
+    home_idx: np.ndarray,
+    away_idx: np.ndarray,
+    n_teams: int,
+) -> np.ndarray:
+    """
+    Accumulate per-team table stats for every simulation using bincount.
+    """
+    n_sims = home_goals.shape[0]
+    offsets = np.arange(n_sims)[:, None] * n_teams
+    home_keys = (offsets + home_idx).ravel()
+    away_keys = (offsets + away_idx).ravel()
+    home_goals = home_goals.ravel()
+    away_goals = away_goals.ravel()
+
+    home_win = home_goals > away_goals
+    away_win = away_goals > home_goals
+    draw = ~(home_win | away_win)
+
+    home_side = [
+        np.ones_like(home_goals),
+        home_win,
+        draw,
+        away_win,
+        home_goals,
+        away_goals,
+        3 * home_win + draw,
+    ]
+    away_side = [
+        np.ones_like(away_goals),
+        away_win,
+        draw,
+        home_win,
+        away_goals,
+        home_goals,
+        3 * away_win + draw,
+    ]
+
+    tables = np.empty((n_sims * n_teams, len(TABLE_COLUMNS)), dtype=np.int32)
+    for column, (home_values, away_values) in enumerate(zip(home_side, away_side)):
+        tables[:, column] = np.bincount(
+            home_keys, weights=home_values, minlength=n_sims * n_teams
+        ) + np.bincount(away_keys, weights=away_values, minlength=n_sims * n_teams)
+
+    return tables.reshape(n_sims, n_teams, len(TABLE_COLUMNS))
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _accumulate_tables_numba(home_goals, away_goals, home_idx, away_idx, n_teams):
+        """
+        Accumulate per-team table stats for every simulation in a compiled loop.
+        """
+        n_sims, n_matches = home_goals.shape
+        tables = np.zeros((n_sims, n_teams, 7), dtype=np.int32)
+        for s in prange(n_sims):
+            for m in range(n_matches):
+                home = home_idx[m]
+                away = away_idx[m]
+                hg = home_goals[s, m]
+                ag = away_goals[s, m]
+                tables[s, home, 0] += 1
+                tables[s, away, 0] += 1
+                tables[s, home, 4] += hg
+                tables[s, home, 5] += ag
+                tables[s, away, 4] += ag
+                tables[s, away, 5] += hg
+                if hg > ag:
+                    tables[s, home, 1] += 1
+                    tables[s, away, 3] += 1
+                    tables[s, home, 6] += 3
+                elif ag > hg:
+                    tables[s, away, 1] += 1
+                    tables[s, home, 3] += 1
+                    tables[s, away, 6] += 3
+                else:
+                    tables[s, home, 2] += 1
+                    tables[s, away, 2] += 1
+                    tables[s, home, 6] += 1
+                    tables[s, away, 6] += 1
+        return tables
+
+    _accumulate_tables = _accumulate_tables_numba
+else:
+    _accumulate_tables = _accumulate_tables_numpy
+
+
+def _rank_tables(tables: np.ndarray) -> np.ndarray:
+    """
+    Order teams within each simulation by points, goal difference and goals for.
+
+    Ties keep the original team order, like the stable sort in
+    calculate_league_table.
+
+    Args:
+        tables: Array of shape (n_simulations, n_teams, len(TABLE_COLUMNS))
+
+    Returns:
+        Array of shape (n_simulations, n_teams) with team indices in finishing order
+    """
+    points = tables[..., _POINTS]
+    goals_for = tables[..., _GOALS_FOR]
+    goal_difference = goals_for - tables[..., _GOALS_AGAINST]
+
+    # lexsort sorts by the last key first and is stable
+    return np.lexsort((-goals_for, -goal_difference, -points), axis=-1)
+
+
+def _simulate_positions(
+    home_goals: np.ndarray,
+    away_goals: np.ndarray,
+    home_idx: np.ndarray,
+    away_idx: np.ndarray,
+    played_table: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Turn simulated goals into final tables and positions, using numpy only.
+
+    Args:
+        home_goals: Simulated home goals, shape (n_simulations, n_matches)
+        away_goals: Simulated away goals, shape (n_simulations, n_matches)
+        home_idx: Team index of the home side of each remaining match
+        away_idx: Team index of the away side of each remaining match
+        played_table: Table of the played matches, shape (n_teams, len(TABLE_COLUMNS))
+
+    Returns:
+        Tuple of:
+        - Final tables, shape (n_simulations, n_teams, len(TABLE_COLUMNS))
+        - Final positions (1-based), shape (n_simulations, n_teams)
+    """
+    n_simulations = home_goals.shape[0]
+    n_teams = played_table.shape[0]
+
+    # The played matches are the same in every simulation, only add the deltas
+    tables = played_table + _accumulate_tables(
+        home_goals, away_goals, home_idx, away_idx, n_teams
+    )
+
+    positions = np.empty((n_simulations, n_teams), dtype=np.int16)
+    np.put_along_axis(
+        positions,
+        _rank_tables(tables),
+        np.arange(1, n_teams + 1, dtype=np.int16)[None, :],
+        axis=1,
+    )
+
+    return tables, positions
+
+
+def _simulate_batch(
+    n_simulations: int,
+    home_codes: np.ndarray,
+    away_codes: np.ndarray,
+    lambda_table: np.ndarray,
+    home_idx: np.ndarray,
+    away_idx: np.ndarray,
+    played_table: np.ndarray,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate a batch of seasons, from goal draws to final positions.
+
+    Module level so it can run in a worker process.
+
+    Returns:
+        Tuple of (home_goals, away_goals, tables, positions) arrays,
+        each with n_simulations rows
+    """
+    home_goals, away_goals = simulate_matches_vectorized(
+        home_codes, away_codes, lambda_table, n_simulations=n_simulations, rng=rng
+    )
+    tables, positions = _simulate_positions(
+        home_goals, away_goals, home_idx, away_idx, played_table
+    )
+
+    return home_goals, away_goals, tables, positions
 
 
 def monte_carlo_simulation(
@@ -61,12 +348,21 @@ def monte_carlo_simulation(
     away_stats: pd.DataFrame,
     n_simulations: int = 1000,
     random_seed: int = None,
-) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
+    rng: Optional[np.random.Generator] = None,
+    n_workers: int = 1,
+    return_matches: bool = False,
+) -> Union[
+    Tuple[np.ndarray, List[str]],
+    Tuple[np.ndarray, List[str], SimulatedSeasonResults],
+]:
     """
     Run Monte Carlo simulation of remaining season matches.
 
     Runs n_simulations complete simulations of the remaining season matches,
-    calculating the final league table for each simulation.
+    calculating the final league positions for each simulation. The goals for
+    all simulations are drawn up front as (n_simulations, n_matches) arrays and
+    the tables are accumulated from them without going through pandas
+    (in a parallel compiled loop when numba is installed).
 
     Args:
         fixtures_df: DataFrame with all season fixtures
@@ -75,85 +371,175 @@ def monte_carlo_simulation(
         away_stats: DataFrame with away team statistics
         n_simulations: Number of simulations to run
         random_seed: Seed for random number generator (optional)
+        rng: Random number generator (optional). If given, random_seed is
+             ignored; otherwise np.random.default_rng(random_seed) is used
+        n_workers: Number of processes to split the simulations over. Each
+                   process uses an independent Generator spawned from rng.
+                   Scripts calling this with n_workers > 1 need an
+                   ``if __name__ == "__main__":`` guard
+        return_matches: Also return the full season results of each simulation
 
     Returns:
         Tuple of:
-        - List of league table DataFrames (one per simulation)
-        - List of full season results DataFrames (one per simulation)
+        - int16 array of shape (n_simulations, n_teams) with the final
+          position (1-based) of each team in each simulation
+        - List of team names, in the column order of the positions array
+        - Only if return_matches: sequence of full season results DataFrames
+          (one per simulation), built lazily on access
+          (see SimulatedSeasonResults)
     """
-    if random_seed is not None:
-        np.random.seed(random_seed)
+    if rng is None:
+        rng = np.random.default_rng(random_seed)
 
-    league_tables = []
-    full_season_results_list = []
-
-    for simulation_number in range(n_simulations):
-        # Identify remaining matches
-        remaining_matches = fixtures_df[fixtures_df["Result"].isnull()].reset_index(
-            drop=True
-        )
-        remaining_matches = remaining_matches[["Home Team", "Away Team"]]
+    # Identify remaining matches
+    remaining_matches = fixtures_df[fixtures_df["Result"].isnull()].reset_index(
+        drop=True
+    )
+    remaining_matches = remaining_matches[["Home Team", "Away Team"]]
+
+    # Flatten the team statistics once, the simulation only uses team codes
+    team_to_code, lambda_table = prepare_lambda_tables(home_stats, away_stats)
+    home_codes = teams_to_codes(remaining_matches["Home Team"], team_to_code)
+    away_codes = teams_to_codes(remaining_matches["Away Team"], team_to_code)
+    _check_missing_statistics(
+        remaining_matches["Home Team"],
+        remaining_matches["Away Team"],
+        *calculate_expected_goals_from_codes(home_codes, away_codes, lambda_table),
+    )
 
-        # Simulate remaining matches
-        simulated_results = simulate_season(remaining_matches, home_stats, away_stats)
+    # Teams in the order calculate_league_table would first encounter them
+    teams = pd.unique(
+        pd.concat(
+            [
+                played_matches_df["Home Team"],
+                remaining_matches["Home Team"],
+                played_matches_df["Away Team"],
+                remaining_matches["Away Team"],
+            ],
+            ignore_index=True,
+        ).to_numpy()
+    )
+    home_idx = pd.Index(teams).get_indexer(remaining_matches["Home Team"])
+    away_idx = pd.Index(teams).get_indexer(remaining_matches["Away Team"])
+
+    # Table of the played matches, aligned to the simulated tables
+    played_table = (
+        calculate_league_table(played_matches_df)
+        .set_index("Team")
+        .reindex(teams, fill_value=0)[TABLE_COLUMNS]
+        .to_numpy(dtype=np.int32)
+    )
 
-        # Combine with played matches
-        full_season_results = pd.concat(
-            [played_matches_df, simulated_results], ignore_index=True
+    batch_args = (home_codes, away_codes, lambda_table, home_idx, away_idx, played_table)
+
+    if n_workers > 1:
+        # Split the simulations over worker processes, each with its own stream
+        batch_sizes = np.full(n_workers, n_simulations // n_workers)
+        batch_sizes[: n_simulations % n_workers] += 1
+
+        # Forking after numba has started its thread pool can deadlock, so
+        # workers are spawned (also the only start method on every platform)
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            batches = list(
+                executor.map(
+                    _simulate_batch,
+                    batch_sizes,
+                    *[repeat(arg) for arg in batch_args],
+                    rng.spawn(n_workers),
+                )
+            )
+
+        home_goals, away_goals, tables, positions = (
+            np.concatenate(arrays) for arrays in zip(*batches)
+        )
+    else:
+        home_goals, away_goals, tables, positions = _simulate_batch(
+            n_simulations, *batch_args, rng
         )
-        full_season_results_list.append(full_season_results)
 
-        # Calculate league table
-        league_table = calculate_league_table(full_season_results)
-        league_tables.append(league_table)
+    if not return_matches:
+        return positions, list(teams)
 
-    return league_tables, full_season_results_list
+    full_season_results = SimulatedSeasonResults(
+        played_matches_df,
+        remaining_matches,
+        home_goals,
+        away_goals,
+        get_match_result_codes(home_goals, away_goals),
+    )
+
+    return positions, list(teams), full_season_results
 
 
 def calculate_position_probabilities(
-    league_tables: List[pd.DataFrame],
+    league_tables: Union[List[pd.DataFrame], np.ndarray],
     current_league_table: pd.DataFrame = None,
     team_names: list = None,
+    position_teams: list = None,
 ) -> pd.DataFrame:
     """
     Calculate probability of each team finishing in each final position.
 
     Args:
-        league_tables: List of league table DataFrames from simulations
+        league_tables: Positions array returned by monte_carlo_simulation
+                       (shape (n_simulations, n_teams)), or a list of
+                       league table DataFrames
         current_league_table: Current season league table to determine team order
                              If provided, results will be sorted by current position
         team_names: List of all team names (in desired order)
-                   If None, derived from current league table or first league table
+                   If None, derived from current league table, position_teams
+                   or first league table
+        position_teams: Team names in the column order of the positions array
+                        (required if league_tables is an array)
 
     Returns:
         DataFrame with shape (n_teams, n_positions) containing probabilities
         Rows are teams (ordered by current league position), columns are final positions (1-18)
     """
-    if not league_tables:
+    if len(league_tables) == 0:
         raise ValueError("league_tables cannot be empty")
 
+    if isinstance(league_tables, np.ndarray):
+        if position_teams is None:
+            raise ValueError("position_teams is required for a positions array")
+        default_team_names = list(position_teams)
+    else:
+        default_team_names = league_tables[0]["Team"].tolist()
+
     # Get team names in order of current league position if available
     if current_league_table is not None:
         team_names = current_league_table["Team"].tolist()
     elif team_names is None:
-        team_names = league_tables[0]["Team"].tolist()
+        team_names = default_team_names
 
     n_teams = len(team_names)
     n_positions = n_teams
 
-    # Initialize position probability DataFrame
+    # Flat team/position arrays over all simulations
+    if isinstance(league_tables, np.ndarray):
+        teams = np.broadcast_to(
+            np.asarray(position_teams, dtype=object), league_tables.shape
+        ).ravel()
+        positions = league_tables.ravel().astype(np.int64)
+    else:
+        teams = np.concatenate([table["Team"].to_numpy() for table in league_tables])
+        positions = np.concatenate(
+            [table["Position"].to_numpy(dtype=np.int64) for table in league_tables]
+        )
+
+    # Count final positions across simulations, ignoring unknown teams
+    team_idx = pd.Index(team_names).get_indexer(teams)
+    known = team_idx >= 0
+    counts = np.zeros((n_teams, n_positions), dtype=np.int64)
+    np.add.at(counts, (team_idx[known], positions[known] - 1), 1)
+
     position_probs = pd.DataFrame(
-        0.0, index=team_names, columns=range(1, n_positions + 1)
+        counts, index=team_names, columns=range(1, n_positions + 1), dtype=float
     )
 
-    # Count final positions across simulations
-    for league_table in league_tables:
-        for _, row in league_table.iterrows():
-            team = row["Team"]
-            position = int(row["Position"])
-            if team in position_probs.index:
-                position_probs.at[team, position] += 1
-
     # Normalize to get probabilities
     position_probs = position_probs.div(position_probs.sum(axis=1), axis=0)
 
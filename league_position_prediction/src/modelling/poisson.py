@@ -7,11 +7,67 @@ football match outcomes based on team statistics and efficiency metrics.
 
 import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+from ..preprocessing.utils import RESULT_LABELS, get_match_result_codes
+
+# Columns of the table returned by prepare_lambda_tables
+HOME_ATTACK, HOME_DEFENSE, AWAY_ATTACK, AWAY_DEFENSE = range(4)
+
+# Statistics used by calculate_expected_goals, in the order of build_stats_cache
+HOME_STATS_COLUMNS = (
+    "avg_home_shots_made",
+    "home_chance_suppression_eff",
+    "home_attack_eff",
+    "home_defense_eff",
+)
+AWAY_STATS_COLUMNS = (
+    "avg_away_shots_made",
+    "away_chance_suppression_eff",
+    "away_attack_eff",
+    "away_defense_eff",
+)
+
+
+def build_stats_cache(
+    stats_df: pd.DataFrame, cols: Sequence[str]
+) -> Dict[str, Tuple[float, ...]]:
+    """
+    Build a team -> statistics lookup from a team statistics DataFrame.
+
+    A plain dict lookup is much cheaper than DataFrame.loc, so repeated
+    calls to calculate_expected_goals/simulate_match should use a cache
+    built once with HOME_STATS_COLUMNS or AWAY_STATS_COLUMNS.
+
+    Args:
+        stats_df: DataFrame with team statistics, indexed by team
+        cols: Columns to keep, in order
+
+    Returns:
+        Dictionary mapping team name to a tuple of the requested values
+    """
+    return dict(
+        zip(
+            stats_df.index,
+            stats_df[list(cols)].itertuples(index=False, name=None),
+        )
+    )
+
+
+def _team_stats(stats, team: str, cols: Sequence[str]) -> Tuple[float, ...]:
+    """
+    Look up a team's statistics in a stats cache or a statistics DataFrame.
+    """
+    if isinstance(stats, pd.DataFrame):
+        return tuple(stats.loc[team, list(cols)])
+    return stats[team]
 
 
 def calculate_expected_goals(
-    home_team: str, away_team: str, home_stats: pd.DataFrame, away_stats: pd.DataFrame
+    home_team: str,
+    away_team: str,
+    home_stats: Union[pd.DataFrame, Dict[str, Tuple[float, ...]]],
+    away_stats: Union[pd.DataFrame, Dict[str, Tuple[float, ...]]],
 ) -> Tuple[float, float]:
     """
     Calculate expected goals for both teams using efficiency metrics.
@@ -22,42 +78,200 @@ def calculate_expected_goals(
     Args:
         home_team: Name of home team
         away_team: Name of away team
-        home_stats: DataFrame with home team statistics
-        away_stats: DataFrame with away team statistics
+        home_stats: DataFrame with home team statistics, or a cache built with
+                    build_stats_cache(home_stats, HOME_STATS_COLUMNS)
+        away_stats: DataFrame with away team statistics, or a cache built with
+                    build_stats_cache(away_stats, AWAY_STATS_COLUMNS)
 
     Returns:
         Tuple of (expected_home_goals, expected_away_goals)
     """
     # Get team statistics
-    home_team_stats = home_stats.loc[home_team]
-    away_team_stats = away_stats.loc[away_team]
-
-    # Get efficiency metrics
-    home_attack_eff = home_stats.loc[home_team, "home_attack_eff"]
-    home_defense_eff = home_stats.loc[home_team, "home_defense_eff"]
-    away_attack_eff = away_stats.loc[away_team, "away_attack_eff"]
-    away_defense_eff = away_stats.loc[away_team, "away_defense_eff"]
+    (
+        home_shots_made,
+        home_chance_suppression_eff,
+        home_attack_eff,
+        home_defense_eff,
+    ) = _team_stats(home_stats, home_team, HOME_STATS_COLUMNS)
+    (
+        away_shots_made,
+        away_chance_suppression_eff,
+        away_attack_eff,
+        away_defense_eff,
+    ) = _team_stats(away_stats, away_team, AWAY_STATS_COLUMNS)
 
     # Calculate expected goals
     expected_home_goals = (
-        home_team_stats["avg_home_shots_made"]
-        * away_team_stats["away_chance_suppression_eff"]
-        * home_attack_eff
-        * away_defense_eff
+        home_shots_made * away_chance_suppression_eff * home_attack_eff * away_defense_eff
     )
 
     expected_away_goals = (
-        away_team_stats["avg_away_shots_made"]
-        * home_team_stats["home_chance_suppression_eff"]
-        * away_attack_eff
-        * home_defense_eff
+        away_shots_made * home_chance_suppression_eff * away_attack_eff * home_defense_eff
+    )
+
+    return expected_home_goals, expected_away_goals
+
+
+def prepare_lambda_tables(
+    home_stats: pd.DataFrame, away_stats: pd.DataFrame
+) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    Flatten the team statistics needed for expected goals into a numpy table.
+
+    The expected goals formula of calculate_expected_goals factorises into one
+    term per team and venue, so each team gets four precomputed factors:
+    - home attack = avg_home_shots_made * home_attack_eff
+    - home defense = home_chance_suppression_eff * home_defense_eff
+    - away attack = avg_away_shots_made * away_attack_eff
+    - away defense = away_chance_suppression_eff * away_defense_eff
+
+    Args:
+        home_stats: DataFrame with home team statistics
+        away_stats: DataFrame with away team statistics
+
+    Returns:
+        Tuple of:
+        - Dictionary mapping team name to team code (row of the table)
+        - Array of shape (n_teams, 4) with the factors above, NaN where a team
+          has no home or away statistics
+    """
+    teams = home_stats.index.union(away_stats.index)
+    home_stats = home_stats.reindex(teams)
+    away_stats = away_stats.reindex(teams)
+
+    lambda_table = np.column_stack(
+        [
+            home_stats["avg_home_shots_made"] * home_stats["home_attack_eff"],
+            home_stats["home_chance_suppression_eff"] * home_stats["home_defense_eff"],
+            away_stats["avg_away_shots_made"] * away_stats["away_attack_eff"],
+            away_stats["away_chance_suppression_eff"] * away_stats["away_defense_eff"],
+        ]
+    ).astype(np.float64)
+
+    team_to_code = {team: code for code, team in enumerate(teams)}
+
+    return team_to_code, lambda_table
+
+
+def calculate_expected_goals_from_codes(
+    home_codes: np.ndarray, away_codes: np.ndarray, lambda_table: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate expected goals for many fixtures given as team codes.
+
+    Args:
+        home_codes: Team codes of the home sides (see prepare_lambda_tables)
+        away_codes: Team codes of the away sides
+        lambda_table: Table returned by prepare_lambda_tables
+
+    Returns:
+        Tuple of (expected_home_goals, expected_away_goals) arrays
+    """
+    expected_home_goals = (
+        lambda_table[home_codes, HOME_ATTACK] * lambda_table[away_codes, AWAY_DEFENSE]
+    )
+    expected_away_goals = (
+        lambda_table[away_codes, AWAY_ATTACK] * lambda_table[home_codes, HOME_DEFENSE]
+    )
+
+    return expected_home_goals, expected_away_goals
+
+
+def calculate_expected_goals_vectorized(
+    home_teams, away_teams, home_stats: pd.DataFrame, away_stats: pd.DataFrame
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate expected goals for many fixtures at once.
+
+    Uses the same formula as calculate_expected_goals, but gathers the team
+    statistics from aligned numpy arrays instead of one .loc lookup per match.
+
+    Args:
+        home_teams: Sequence of home team names (one per fixture)
+        away_teams: Sequence of away team names (one per fixture)
+        home_stats: DataFrame with home team statistics
+        away_stats: DataFrame with away team statistics
+
+    Returns:
+        Tuple of (expected_home_goals, expected_away_goals) arrays
+    """
+    home_teams = np.asarray(home_teams)
+    away_teams = np.asarray(away_teams)
+
+    team_to_code, lambda_table = prepare_lambda_tables(home_stats, away_stats)
+    home_codes = teams_to_codes(home_teams, team_to_code)
+    away_codes = teams_to_codes(away_teams, team_to_code)
+
+    expected_home_goals, expected_away_goals = calculate_expected_goals_from_codes(
+        home_codes, away_codes, lambda_table
+    )
+
+    _check_missing_statistics(
+        home_teams, away_teams, expected_home_goals, expected_away_goals
     )
 
     return expected_home_goals, expected_away_goals
 
 
+def _check_missing_statistics(
+    home_teams,
+    away_teams,
+    expected_home_goals: np.ndarray,
+    expected_away_goals: np.ndarray,
+) -> None:
+    """
+    Raise if any fixture's expected goals could not be computed.
+
+    A team with home but no away statistics (or the other way round) has NaN
+    factors in the lambda table, which would otherwise only surface as an
+    obscure error inside rng.poisson.
+
+    Args:
+        home_teams: Sequence of home team names (one per fixture)
+        away_teams: Sequence of away team names (one per fixture)
+        expected_home_goals: Expected home goals per fixture
+        expected_away_goals: Expected away goals per fixture
+
+    Raises:
+        KeyError: If a fixture has NaN expected goals
+    """
+    missing = np.isnan(expected_home_goals) | np.isnan(expected_away_goals)
+    if missing.any():
+        home_teams = np.asarray(home_teams)
+        away_teams = np.asarray(away_teams)
+        raise KeyError(
+            "No statistics for fixtures: "
+            f"{list(zip(home_teams[missing], away_teams[missing]))}"
+        )
+
+
+def teams_to_codes(teams, team_to_code: Dict[str, int]) -> np.ndarray:
+    """
+    Convert team names to team codes.
+
+    Args:
+        teams: Sequence of team names
+        team_to_code: Dictionary mapping team name to team code
+
+    Returns:
+        Integer array of team codes
+
+    Raises:
+        KeyError: If a team is not in team_to_code
+    """
+    missing = set(teams) - team_to_code.keys()
+    if missing:
+        raise KeyError(f"No statistics for teams: {sorted(missing)}")
+
+    return np.array([team_to_code[team] for team in teams], dtype=np.intp)
+
+
 def simulate_match(
-    home_team: str, away_team: str, home_stats: pd.DataFrame, away_stats: pd.DataFrame
+    home_team: str,
+    away_team: str,
+    home_stats: Union[pd.DataFrame, Dict[str, Tuple[float, ...]]],
+    away_stats: Union[pd.DataFrame, Dict[str, Tuple[float, ...]]],
+    rng: Optional[np.random.Generator] = None,
 ) -> Tuple[int, int]:
     """
     Simulate a single football match using Poisson distribution.
@@ -68,12 +282,16 @@ def simulate_match(
     Args:
         home_team: Name of home team
         away_team: Name of away team
-        home_stats: DataFrame with home team statistics
-        away_stats: DataFrame with away team statistics
+        home_stats: DataFrame with home team statistics (or stats cache)
+        away_stats: DataFrame with away team statistics (or stats cache)
+        rng: Random number generator (optional, defaults to np.random)
 
     Returns:
         Tuple of (home_goals, away_goals)
     """
+    if rng is None:
+        rng = np.random
+
     # Calculate expected goals
     expected_home_goals, expected_away_goals = calculate_expected_goals(
         home_team, away_team, home_stats, away_stats
@@ -84,12 +302,85 @@ def simulate_match(
     expected_away_goals = max(0.1, min(expected_away_goals, 20))
 
     # Sample goals from Poisson distribution
-    home_goals = np.random.poisson(expected_home_goals)
-    away_goals = np.random.poisson(expected_away_goals)
+    home_goals = rng.poisson(expected_home_goals)
+    away_goals = rng.poisson(expected_away_goals)
 
     return int(home_goals), int(away_goals)
 
 
+def simulate_matches(
+    expected_home_goals: np.ndarray,
+    expected_away_goals: np.ndarray,
+    n_simulations: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate many football matches at once using Poisson distribution.
+
+    Vectorized counterpart of simulate_match: all goals are drawn with a
+    single Poisson call per side. If n_simulations is given, every fixture is
+    simulated n_simulations times and the returned arrays have shape
+    (n_simulations, n_matches).
+
+    Args:
+        expected_home_goals: Array of expected home goals (one per fixture)
+        expected_away_goals: Array of expected away goals (one per fixture)
+        n_simulations: Number of independent draws per fixture (optional)
+        rng: Random number generator (optional, defaults to np.random)
+
+    Returns:
+        Tuple of (home_goals, away_goals) integer arrays
+    """
+    if rng is None:
+        rng = np.random
+
+    # Bound expected goals to avoid numerical issues
+    expected_home_goals = np.clip(expected_home_goals, 0.1, 20)
+    expected_away_goals = np.clip(expected_away_goals, 0.1, 20)
+
+    size = None
+    if n_simulations is not None:
+        size = (n_simulations, len(expected_home_goals))
+
+    # Sample goals from Poisson distribution
+    home_goals = rng.poisson(expected_home_goals, size=size)
+    away_goals = rng.poisson(expected_away_goals, size=size)
+
+    return home_goals, away_goals
+
+
+def simulate_matches_vectorized(
+    home_codes: np.ndarray,
+    away_codes: np.ndarray,
+    lambda_table: np.ndarray,
+    n_simulations: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate many football matches given as team codes.
+
+    Combines calculate_expected_goals_from_codes and simulate_matches, without
+    any DataFrame lookups.
+
+    Args:
+        home_codes: Team codes of the home sides (see prepare_lambda_tables)
+        away_codes: Team codes of the away sides
+        lambda_table: Table returned by prepare_lambda_tables
+        n_simulations: Number of independent draws per fixture (optional)
+        rng: Random number generator (optional, defaults to np.random)
+
+    Returns:
+        Tuple of (home_goals, away_goals) integer arrays
+    """
+    expected_home_goals, expected_away_goals = calculate_expected_goals_from_codes(
+        home_codes, away_codes, lambda_table
+    )
+
+    return simulate_matches(
+        expected_home_goals, expected_away_goals, n_simulations=n_simulations, rng=rng
+    )
+
+
 def get_match_result(home_goals: int, away_goals: int) -> str:
     """
     Determine match result from goal counts.
@@ -107,3 +398,17 @@ def get_match_result(home_goals: int, away_goals: int) -> str:
         return "A"
     else:
         return "D"
+
+
+def get_match_results(home_goals: np.ndarray, away_goals: np.ndarray) -> np.ndarray:
+    """
+    Determine match results from arrays of goal counts.
+
+    Args:
+        home_goals: Array of home team goals
+        away_goals: Array of away team goals
+
+    Returns:
+        Array of result codes: "H" (home win), "A" (away win), or "D" (draw)
+    """
+    return RESULT_LABELS[get_match_result_codes(home_goals, away_goals)]
@@ -9,6 +9,8 @@ from .statistics import (
     calculate_league_table,
 )
 from .utils import (
+    get_match_result_codes,
+    add_result_codes,
     split_result_column,
     create_played_matches_dataframe,
     create_remaining_matches_dataframe,
@@ -19,6 +21,8 @@ __all__ = [
     "calculate_away_team_statistics",
     "calculate_efficiency_metrics",
     "calculate_league_table",
+    "get_match_result_codes",
+    "add_result_codes",
     "split_result_column",
     "create_played_matches_dataframe",
     "create_remaining_matches_dataframe",
@@ -7,7 +7,40 @@ including goals, shots, and efficiency metrics needed for the Poisson model.
 
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from typing import List, Tuple
+
+from .utils import HOME_WIN, AWAY_WIN, DRAW, get_match_result_codes
+
+
+def _mean_by_team(
+    stats_df: pd.DataFrame, team_col: str, value_cols: List[str]
+) -> pd.DataFrame:
+    """
+    Average value columns per team with numpy (sort, np.unique, np.add.reduceat).
+
+    Equivalent to stats_df.groupby(team_col)[value_cols].mean(): rows without a
+    team are dropped, missing values are skipped and teams are sorted by name.
+    """
+    stats_df = stats_df[stats_df[team_col].notna()]
+    keys = stats_df[team_col].to_numpy().astype(str)
+    values = stats_df[value_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    values = values[order]
+
+    teams, starts = np.unique(keys, return_index=True)
+
+    present = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(present, values, 0.0), starts, axis=0)
+    counts = np.add.reduceat(present, starts, axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+
+    return pd.DataFrame(
+        means, index=pd.Index(teams, name=team_col), columns=value_cols
+    )
 
 
 def calculate_home_team_statistics(stats_df: pd.DataFrame) -> pd.DataFrame:
@@ -29,13 +62,8 @@ def calculate_home_team_statistics(stats_df: pd.DataFrame) -> pd.DataFrame:
         - avg_home_shots_made
         - avg_home_shots_conceded
     """
-    home_stats = stats_df.groupby("Home Team").agg(
-        {
-            "Home Goals": "mean",
-            "Away Goals": "mean",
-            "Home Shots": "mean",
-            "Away Shots": "mean",
-        }
+    home_stats = _mean_by_team(
+        stats_df, "Home Team", ["Home Goals", "Away Goals", "Home Shots", "Away Shots"]
     )
 
     home_stats.columns = [
@@ -67,13 +95,8 @@ def calculate_away_team_statistics(stats_df: pd.DataFrame) -> pd.DataFrame:
         - avg_away_shots_made
         - avg_away_shots_conceded
     """
-    away_stats = stats_df.groupby("Away Team").agg(
-        {
-            "Away Goals": "mean",
-            "Home Goals": "mean",
-            "Away Shots": "mean",
-            "Home Shots": "mean",
-        }
+    away_stats = _mean_by_team(
+        stats_df, "Away Team", ["Away Goals", "Home Goals", "Away Shots", "Home Shots"]
     )
 
     away_stats.columns = [
@@ -86,6 +109,18 @@ def calculate_away_team_statistics(stats_df: pd.DataFrame) -> pd.DataFrame:
     return away_stats
 
 
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """
+    Divide element-wise, returning 0 where the denominator is 0.
+    """
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator, dtype=np.float64),
+        where=denominator != 0,
+    )
+
+
 def calculate_efficiency_metrics(
     home_stats: pd.DataFrame, away_stats: pd.DataFrame
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -108,51 +143,91 @@ def calculate_efficiency_metrics(
     home_stats = home_stats.copy()
     away_stats = away_stats.copy()
 
+    # Goals scored, goals conceded, shots made, shots conceded per team
+    home_values = home_stats[
+        [
+            "avg_home_goals_scored",
+            "avg_home_goals_conceded",
+            "avg_home_shots_made",
+            "avg_home_shots_conceded",
+        ]
+    ].to_numpy(dtype=np.float64)
+    away_values = away_stats[
+        [
+            "avg_away_goals_scored",
+            "avg_away_goals_conceded",
+            "avg_away_shots_made",
+            "avg_away_shots_conceded",
+        ]
+    ].to_numpy(dtype=np.float64)
+
     # Calculate league averages for shots made and conceded
-    league_avg_home_shots_made = home_stats["avg_home_shots_made"].mean()
-    league_avg_home_shots_conceded = home_stats["avg_home_shots_conceded"].mean()
-    league_avg_away_shots_made = away_stats["avg_away_shots_made"].mean()
-    league_avg_away_shots_conceded = away_stats["avg_away_shots_conceded"].mean()
+    league_avg_home_shots = np.nanmean(home_values[:, 2:], axis=0)
+    league_avg_away_shots = np.nanmean(away_values[:, 2:], axis=0)
 
     # Calculate chance creation and suppression efficiency for home and away teams compared to league averages
-    # Avoid division by zero
     home_stats["home_chance_creation_eff"] = (
-        home_stats["avg_home_shots_made"] / league_avg_away_shots_made
+        home_values[:, 2] / league_avg_away_shots[0]
     )
     home_stats["home_chance_suppression_eff"] = (
-        home_stats["avg_home_shots_conceded"] / league_avg_away_shots_conceded
+        home_values[:, 3] / league_avg_away_shots[1]
     )
     away_stats["away_chance_creation_eff"] = (
-        away_stats["avg_away_shots_made"] / league_avg_home_shots_made
+        away_values[:, 2] / league_avg_home_shots[0]
     )
     away_stats["away_chance_suppression_eff"] = (
-        away_stats["avg_away_shots_conceded"] / league_avg_home_shots_conceded
+        away_values[:, 3] / league_avg_home_shots[1]
     )
 
-    # Calculate attacking and defensive efficiency
-    home_stats["home_attack_eff"] = home_stats["avg_home_goals_scored"] / home_stats[
-        "avg_home_shots_made"
-    ].replace(0, np.nan)
-
-    home_stats["home_defense_eff"] = home_stats["avg_home_goals_conceded"] / home_stats[
-        "avg_home_shots_conceded"
-    ].replace(0, np.nan)
+    # Calculate attacking and defensive efficiency (goals per shot)
+    # Avoid division by zero: teams with 0 shots get an efficiency of 0
+    home_efficiency = _safe_divide(home_values[:, :2], home_values[:, 2:])
+    away_efficiency = _safe_divide(away_values[:, :2], away_values[:, 2:])
 
-    away_stats["away_attack_eff"] = away_stats["avg_away_goals_scored"] / away_stats[
-        "avg_away_shots_made"
-    ].replace(0, np.nan)
+    home_stats["home_attack_eff"] = home_efficiency[:, 0]
+    home_stats["home_defense_eff"] = home_efficiency[:, 1]
+    away_stats["away_attack_eff"] = away_efficiency[:, 0]
+    away_stats["away_defense_eff"] = away_efficiency[:, 1]
 
-    away_stats["away_defense_eff"] = away_stats["avg_away_goals_conceded"] / away_stats[
-        "avg_away_shots_conceded"
-    ].replace(0, np.nan)
-
-    # Fill NaN values with 0 (for teams with 0 shots)
+    # Fill remaining NaN values with 0 (for teams with missing statistics)
     home_stats = home_stats.fillna(0)
     away_stats = away_stats.fillna(0)
 
     return home_stats, away_stats
 
 
+def _result_codes(matches_df: pd.DataFrame) -> np.ndarray:
+    """
+    Integer result code (0/1/2) of every match.
+
+    Uses the "ResultCode" column where it is set. Rows without a code (e.g.
+    results concatenated from a frame that only has labels) fall back to the
+    H/A/D "Result" label, or to the goals when there is no "Result" column.
+    """
+    codes = None
+    if "ResultCode" in matches_df.columns:
+        codes = matches_df["ResultCode"]
+        missing = codes.isna().to_numpy()
+        if not missing.any():
+            return codes.to_numpy()
+
+    if "Result" in matches_df.columns:
+        result = matches_df["Result"]
+        fallback = np.where(
+            result == "H", HOME_WIN, np.where(result == "A", AWAY_WIN, DRAW)
+        )
+    else:
+        fallback = get_match_result_codes(
+            matches_df["Home Goals"].to_numpy(), matches_df["Away Goals"].to_numpy()
+        )
+
+    if codes is None:
+        return fallback
+    return np.where(
+        missing, fallback, codes.to_numpy(dtype=np.float64, na_value=np.nan)
+    ).astype(np.int8)
+
+
 def calculate_league_table(matches_df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate the league table from match results.
@@ -165,7 +240,8 @@ def calculate_league_table(matches_df: pd.DataFrame) -> pd.DataFrame:
     Args:
         matches_df: DataFrame with match results
                    Expected columns: "Home Team", "Away Team", "Home Goals",
-                                    "Away Goals", "Result" (H/A/D)
+                                    "Away Goals", and "ResultCode" (0/1/2)
+                                    or "Result" (H/A/D)
 
     Returns:
         DataFrame with league table including columns:
@@ -180,57 +256,56 @@ def calculate_league_table(matches_df: pd.DataFrame) -> pd.DataFrame:
         - Points
         - Position
     """
-    teams = matches_df["Home Team"].unique()
+    home_goals = matches_df["Home Goals"]
+    away_goals = matches_df["Away Goals"]
+
+    result_codes = _result_codes(matches_df)
+    home_wins = (result_codes == HOME_WIN).astype(np.int64)
+    away_wins = (result_codes == AWAY_WIN).astype(np.int64)
+    draws = 1 - home_wins - away_wins
+
+    # One row per team per match, seen from the home and from the away side
+    home_view = pd.DataFrame(
+        {
+            "Team": matches_df["Home Team"],
+            "Wins": home_wins,
+            "Draws": draws,
+            "Losses": away_wins,
+            "Goals For": home_goals,
+            "Goals Against": away_goals,
+        }
+    )
+    away_view = pd.DataFrame(
+        {
+            "Team": matches_df["Away Team"],
+            "Wins": away_wins,
+            "Draws": draws,
+            "Losses": home_wins,
+            "Goals For": away_goals,
+            "Goals Against": home_goals,
+        }
+    )
+
+    totals = pd.concat([home_view, away_view], ignore_index=True).groupby(
+        "Team", sort=False, observed=True
+    ).sum()
+
     league_table = pd.DataFrame(
         {
-            "Team": teams,
-            "Played": 0,
-            "Wins": 0,
-            "Draws": 0,
-            "Losses": 0,
-            "Goals For": 0,
-            "Goals Against": 0,
-            "Goal Difference": 0,
-            "Points": 0,
+            "Played": totals["Wins"] + totals["Draws"] + totals["Losses"],
+            "Wins": totals["Wins"],
+            "Draws": totals["Draws"],
+            "Losses": totals["Losses"],
+            "Goals For": totals["Goals For"],
+            "Goals Against": totals["Goals Against"],
+            "Points": 3 * totals["Wins"] + totals["Draws"],
         }
     )
-    league_table.set_index("Team", inplace=True)
-
-    for _, match in matches_df.iterrows():
-        home_team = match["Home Team"]
-        away_team = match["Away Team"]
-        home_goals = match["Home Goals"]
-        away_goals = match["Away Goals"]
-        result = match["Result"]
-
-        # Update match counts
-        league_table.at[home_team, "Played"] += 1
-        league_table.at[away_team, "Played"] += 1
-
-        # Update goals
-        league_table.at[home_team, "Goals For"] += home_goals
-        league_table.at[home_team, "Goals Against"] += away_goals
-        league_table.at[away_team, "Goals For"] += away_goals
-        league_table.at[away_team, "Goals Against"] += home_goals
-
-        # Update wins/draws/losses and points
-        if result == "H":
-            league_table.at[home_team, "Wins"] += 1
-            league_table.at[away_team, "Losses"] += 1
-            league_table.at[home_team, "Points"] += 3
-        elif result == "A":
-            league_table.at[away_team, "Wins"] += 1
-            league_table.at[home_team, "Losses"] += 1
-            league_table.at[away_team, "Points"] += 3
-        else:  # Draw
-            league_table.at[home_team, "Draws"] += 1
-            league_table.at[away_team, "Draws"] += 1
-            league_table.at[home_team, "Points"] += 1
-            league_table.at[away_team, "Points"] += 1
+    league_table.index.name = "Team"
 
     # Calculate goal difference
-    league_table["Goal Difference"] = (
-        league_table["Goals For"] - league_table["Goals Against"]
+    league_table.insert(
+        6, "Goal Difference", league_table["Goals For"] - league_table["Goals Against"]
     )
 
     # Sort by points, goal difference, and goals for
@@ -239,6 +314,6 @@ def calculate_league_table(matches_df: pd.DataFrame) -> pd.DataFrame:
     )
 
     # Add position column
-    league_table["Position"] = range(1, len(league_table) + 1)
+    league_table["Position"] = np.arange(1, len(league_table) + 1)
 
     return league_table.reset_index()
@@ -2,9 +2,53 @@
 Utility functions for data preprocessing.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Tuple
 
+# Integer result codes, stored in the "ResultCode" column
+HOME_WIN, AWAY_WIN, DRAW = 0, 1, 2
+
+# Result labels indexed by result code
+RESULT_LABELS = np.array(["H", "A", "D"], dtype=object)
+
+
+def get_match_result_codes(
+    home_goals: np.ndarray, away_goals: np.ndarray
+) -> np.ndarray:
+    """
+    Determine integer match result codes from arrays of goal counts.
+
+    Args:
+        home_goals: Array of home team goals
+        away_goals: Array of away team goals
+
+    Returns:
+        int8 array of result codes: 0 (home win), 1 (away win), or 2 (draw)
+    """
+    return np.where(
+        home_goals > away_goals,
+        HOME_WIN,
+        np.where(away_goals > home_goals, AWAY_WIN, DRAW),
+    ).astype(np.int8)
+
+
+def add_result_codes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add an int8 "ResultCode" column (0=H, 1=A, 2=D) computed from the goals.
+
+    Args:
+        df: DataFrame with "Home Goals" and "Away Goals" columns
+
+    Returns:
+        DataFrame with the additional "ResultCode" column
+    """
+    return df.assign(
+        ResultCode=get_match_result_codes(
+            df["Home Goals"].to_numpy(), df["Away Goals"].to_numpy()
+        )
+    )
+
 
 def split_result_column(
     df: pd.DataFrame, result_col: str = "Result"
@@ -20,32 +64,17 @@ def split_result_column(
         Tuple of (updated DataFrame with Home Goals and Away Goals columns,
                   list of rows with invalid format)
     """
-    df = df.copy()
-    invalid_rows = []
-
-    def parse_result(result):
-        if pd.isna(result):
-            return None, None
-        try:
-            parts = str(result).split("-")
-            if len(parts) != 2:
-                return None, None
-            return int(parts[0].strip()), int(parts[1].strip())
-        except (ValueError, AttributeError):
-            return None, None
-
-    home_goals = []
-    away_goals = []
-
-    for idx, result in enumerate(df[result_col]):
-        home, away = parse_result(result)
-        if home is None or away is None:
-            invalid_rows.append(idx)
-        home_goals.append(home)
-        away_goals.append(away)
-
-    df["Home Goals"] = home_goals
-    df["Away Goals"] = away_goals
+    # Parse all results in one pass, anything not shaped like "2-1" becomes NA
+    goals = (
+        df[result_col]
+        .astype("string")
+        .str.extract(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+        .astype("Int64")
+    )
+
+    df = df.assign(**{"Home Goals": goals[0], "Away Goals": goals[1]})
+
+    invalid_rows = np.flatnonzero(goals.isna().any(axis=1).to_numpy()).tolist()
 
     return df, invalid_rows
 
@@ -59,14 +88,16 @@ def create_played_matches_dataframe(stats_df: pd.DataFrame) -> pd.DataFrame:
 
     Returns:
         DataFrame with played matches only, relevant columns selected
+        and an int8 "ResultCode" column (see add_result_codes)
     """
-    df = stats_df.copy()
-
     # Drop unnecessary columns
     columns_to_keep = ["Home Team", "Away Team", "Home Goals", "Away Goals", "Result"]
-    columns_to_keep = [col for col in columns_to_keep if col in df.columns]
+    columns_to_keep = [col for col in columns_to_keep if col in stats_df.columns]
 
-    df = df[columns_to_keep]
+    df = stats_df[columns_to_keep]
+
+    if "Home Goals" in df.columns and "Away Goals" in df.columns:
+        df = add_result_codes(df)
 
     return df
 
@@ -81,10 +112,8 @@ def create_remaining_matches_dataframe(fixtures_df: pd.DataFrame) -> pd.DataFram
     Returns:
         DataFrame with remaining matches only
     """
-    df = fixtures_df.copy()
-
     # Filter for matches without results
-    remaining = df[df["Result"].isnull()].reset_index(drop=True)
+    remaining = fixtures_df[fixtures_df["Result"].isnull()].reset_index(drop=True)
 
     # Drop unnecessary columns
     columns_to_keep = ["Home Team", "Away Team"]
@@ -7,6 +7,9 @@ from .plots import (
     plot_position_probabilities_heatmap,
     plot_team_position_distribution,
     plot_multiple_teams_distribution,
+    plot_async,
+    wait_for_plots,
+    PlotData,
 )
 
 __all__ = [
@@ -14,4 +17,7 @@ __all__ = [
     "plot_position_probabilities_heatmap",
     "plot_team_position_distribution",
     "plot_multiple_teams_distribution",
+    "plot_async",
+    "wait_for_plots",
+    "PlotData",
 ]
@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled formatting of heatmap annotations.
+
+Optional extension used by the visualization module when it has been built,
+e.g. with ``cythonize -i src/visualization/_fastfmt.pyx``. Without it the
+annotations are formatted with np.char.mod.
+"""
+
+import numpy as np
+
+from libc.stdio cimport snprintf
+
+
+def format_percents(const double[:, ::1] probs, int decimals):
+    """
+    Format probabilities as percentage strings.
+
+    Args:
+        probs: C-contiguous float64 array of probabilities
+        decimals: Number of decimal places
+
+    Returns:
+        Object array of strings such as "12.35%" with the same shape as probs
+    """
+    cdef Py_ssize_t n_rows = probs.shape[0]
+    cdef Py_ssize_t n_cols = probs.shape[1]
+    cdef Py_ssize_t i, j
+    cdef int length
+    cdef char buf[32]
+
+    out = np.empty((n_rows, n_cols), dtype=object)
+    for i in range(n_rows):
+        for j in range(n_cols):
+            length = snprintf(buf, sizeof(buf), b"%.*f%%", decimals, probs[i, j] * 100.0)
+            if 0 <= length < sizeof(buf):
+                out[i, j] = buf[:length].decode("ascii")
+            else:
+                # Truncated by snprintf, format this cell in Python instead
+                out[i, j] = "%.*f%%" % (decimals, probs[i, j] * 100.0)
+    return out
@@ -2,19 +2,378 @@
 Visualization module for plots and charts.
 
 This module provides functions to visualize team statistics and Monte Carlo results.
+
+Set the environment variable FOOTBALL_DS_HEADLESS=1 for batch runs: matplotlib
+is then switched to the Agg backend on import and plt.show() is skipped (the
+figure is closed instead), so figures are only produced via show=False (e.g.
+to save them to file).
 """
 
+import os
+import queue
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
+
+import matplotlib
+
+# Headless runs render with Agg and never open a window
+_HEADLESS = os.environ.get("FOOTBALL_DS_HEADLESS") == "1"
+if _HEADLESS:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
-from typing import Optional
+from matplotlib.figure import Figure
+from matplotlib.ticker import PercentFormatter
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+from typing import Callable, Optional, Tuple, Union
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, fall back to numpy
+    njit = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional, labels are then drawn at their points
+    cKDTree = None
+
+try:
+    from ._fastfmt import format_percents
+except ImportError:  # compiled extension is optional, fall back to np.char.mod
+    format_percents = None
+
+# Heatmap colormap, resolved once and shared by every heatmap call
+_CMAP_YLGNBU = matplotlib.colormaps["YlGnBu"]
+
+# Styling passed to sns.heatmap on every call
+_HEATMAP_KW = dict(
+    cmap=_CMAP_YLGNBU,
+    linewidths=0.5,
+    linecolor="gray",
+    cbar_kws={"label": "Probability"},
+)
+
+# YlGnBu colormap as a uint8 RGB lookup table for the fast heatmap path
+_HEATMAP_LUT = (_CMAP_YLGNBU(np.linspace(0, 1, 256))[:, :3] * 255).astype(np.uint8)
+
+# Format specs that map directly onto printf-style formats for np.char.mod:
+# ".N%" percentages and plain numeric specs such as ".3f" or "g"
+_PERCENT_SPEC = re.compile(r"\.(\d+)%")
+_PRINTF_SPEC = re.compile(r"[-+ #0]*\d*(\.\d+)?[eEfFgG]")
+
+
+def _format_annotations(values: np.ndarray, annot_fmt: str) -> np.ndarray:
+    """
+    Format heatmap cell values as annotation strings.
+    
+    Percentages and printf-compatible specs are formatted in one vectorized
+    call; any other spec falls back to Python's format() per cell.
+    
+    Args:
+        values: Array of cell values
+        annot_fmt: Format spec as accepted by seaborn's fmt (e.g. ".2%", ".3f")
+    
+    Returns:
+        Array of formatted strings with the same shape as values
+    """
+    percent = _PERCENT_SPEC.fullmatch(annot_fmt)
+    if percent:
+        decimals = int(percent.group(1))
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if format_percents is not None:
+            return format_percents(values, decimals)
+        return np.char.mod(f"%.{decimals}f%%", values * 100)
+    if _PRINTF_SPEC.fullmatch(annot_fmt):
+        return np.char.mod("%" + annot_fmt, values)
+    return np.vectorize(lambda value: format(value, annot_fmt), otypes=[str])(values)
+
+
+# Team labels closer than this (in goals per match) are pushed apart
+_LABEL_RADIUS = 0.1
+
+# subplots_adjust parameters computed by tight_layout, keyed by plot kind,
+# figure size and axes texts, for the most recently used layouts
+_LAYOUT_CACHE_SIZE = 32
+_layout_cache: OrderedDict = OrderedDict()
+
+
+def _layout_texts(fig: Figure) -> tuple:
+    """
+    Collect the texts that set the margins of fig, without drawing it.
+    
+    Args:
+        fig: Figure whose axes are inspected
+    
+    Returns:
+        Tuple with, per axes, its title, axis labels and major tick labels
+    """
+    texts = []
+    for ax in fig.axes:
+        texts.append((ax.get_title(), ax.get_xlabel(), ax.get_ylabel()))
+        for axis in (ax.xaxis, ax.yaxis):
+            ticks = axis.get_major_locator()()
+            texts.append(tuple(axis.get_major_formatter().format_ticks(ticks)))
+    return tuple(texts)
+
+
+def _apply_layout(fig: Figure, kind: str) -> None:
+    """
+    Apply tight_layout to fig, reusing the result for equivalent figures.
+    
+    tight_layout measures every artist, so the resulting subplot parameters
+    are stored and later figures of the same kind and size with the same
+    titles, axis labels and tick labels (which set the margins) are adjusted
+    to them directly. Only the most recently used layouts are kept.
+    
+    Args:
+        fig: Figure to lay out
+        kind: Name of the plot type
+    """
+    key = (kind, tuple(fig.get_size_inches()), _layout_texts(fig))
+    params = _layout_cache.get(key)
+    if params is None:
+        fig.tight_layout()
+        subplotpars = fig.subplotpars
+        _layout_cache[key] = {
+            "left": subplotpars.left,
+            "bottom": subplotpars.bottom,
+            "right": subplotpars.right,
+            "top": subplotpars.top,
+        }
+        if len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+            _layout_cache.popitem(last=False)
+    else:
+        _layout_cache.move_to_end(key)
+        fig.subplots_adjust(**params)
+
+
+def _label_offsets(points: np.ndarray, radius: float = _LABEL_RADIUS) -> np.ndarray:
+    """
+    Compute offsets that push apart labels of points closer than radius.
+    
+    Each close pair found with a KD-tree is moved apart along the line
+    joining the two points until they are radius apart; pushes from several
+    neighbours add up. Without scipy all offsets are zero, as are those of
+    points with a missing coordinate.
+    
+    Args:
+        points: Array of shape (n, 2) with the label anchor points
+        radius: Minimum distance wanted between labels, in data units
+    
+    Returns:
+        Array of shape (n, 2) with the offset to add to each point
+    """
+    offsets = np.zeros_like(points, dtype=np.float64)
+    finite = np.flatnonzero(np.isfinite(points).all(axis=1))
+    if cKDTree is None or len(finite) < 2:
+        return offsets
+    
+    pairs = cKDTree(points[finite]).query_pairs(r=radius, output_type="ndarray")
+    if len(pairs) == 0:
+        return offsets
+    
+    # Map pair indices back to rows of points
+    pairs = finite[pairs]
+    delta = points[pairs[:, 0]] - points[pairs[:, 1]]
+    dist = np.hypot(delta[:, 0], delta[:, 1])
+    # Coincident points are pushed apart vertically
+    direction = np.where(
+        dist[:, None] > 0,
+        delta / np.maximum(dist, np.finfo(np.float64).tiny)[:, None],
+        [0.0, 1.0]
+    )
+    push = ((radius - dist) / 2)[:, None] * direction
+    np.add.at(offsets, pairs[:, 0], push)
+    np.add.at(offsets, pairs[:, 1], -push)
+    return offsets
+
+
+def _canonicalize(position_probs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Put a position probability table in the form the plot functions expect.
+    
+    Columns (final positions) are sorted ascending and values are float64.
+    Row order is kept, since it is the display order of the teams. A table
+    that is already canonical is returned as is, so plotting the same table
+    repeatedly does not redo the sort or the conversion.
+    
+    Args:
+        position_probs: DataFrame with position probabilities
+    
+    Returns:
+        Canonical DataFrame with the same rows and columns
+    """
+    if not position_probs.columns.is_monotonic_increasing:
+        position_probs = position_probs.sort_index(axis=1)
+    if not (position_probs.dtypes == np.float64).all():
+        position_probs = position_probs.astype(np.float64)
+    return position_probs
+
+
+@dataclass(frozen=True, eq=False)
+class PlotData:
+    """
+    Position probabilities converted to arrays once, for plotting repeatedly.
+    
+    Build it with PlotData.from_frame and pass it to the position probability
+    plot functions in place of the DataFrame to skip the per-call conversion.
+    
+    Attributes:
+        values: float64 array of shape (n_teams, n_positions)
+        teams: Team names in row order
+        positions: int64 array of final positions in column order
+    """
+    values: np.ndarray
+    teams: tuple
+    positions: np.ndarray
+    
+    @classmethod
+    def from_frame(cls, position_probs: pd.DataFrame) -> "PlotData":
+        """
+        Build plot data from a position probabilities DataFrame.
+        
+        Args:
+            position_probs: DataFrame with position probabilities
+        
+        Returns:
+            PlotData holding the table's values and labels
+        """
+        position_probs = _canonicalize(position_probs)
+        return cls(
+            values=position_probs.to_numpy(dtype=np.float64, copy=False),
+            teams=tuple(position_probs.index.tolist()),
+            positions=position_probs.columns.to_numpy(dtype=np.int64)
+        )
+
+
+def _as_plot_data(position_probs: Union[pd.DataFrame, PlotData]) -> PlotData:
+    """
+    Return position_probs as PlotData, converting a DataFrame if needed.
+    """
+    if isinstance(position_probs, PlotData):
+        return position_probs
+    return PlotData.from_frame(position_probs)
+
+
+def _probs_to_rgb_numpy(probs: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """
+    Map values in [0, 1] to RGB colours through a 256-entry lookup table.
+    """
+    idx = np.clip((probs * 255).astype(np.int64), 0, 255)
+    return lut[idx]
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _probs_to_rgb_numba(probs, lut):
+        """
+        Map values in [0, 1] to RGB colours in a parallel compiled loop.
+        """
+        n_rows, n_cols = probs.shape
+        out = np.empty((n_rows, n_cols, 3), dtype=np.uint8)
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                idx = min(255, max(0, int(probs[i, j] * 255)))
+                for c in range(3):
+                    out[i, j, c] = lut[idx, c]
+        return out
+
+    _probs_to_rgb = _probs_to_rgb_numba
+else:
+    _probs_to_rgb = _probs_to_rgb_numpy
+
+
+@lru_cache(maxsize=8)
+def _heatmap_cells(values_bytes: bytes,
+                   n_rows: int,
+                   n_cols: int,
+                   annot_fmt: str,
+                   use_fast: bool) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Compute the per-cell content of a heatmap: annotations and, for the fast
+    path, the RGB image.
+    
+    Cached on the raw bytes of the probability values so repeated calls with
+    an identical table skip formatting and colouring the cells. The returned
+    arrays are shared between calls and therefore read-only.
+    
+    Args:
+        values_bytes: float64 probability values as returned by ndarray.tobytes()
+        n_rows: Number of teams (heatmap rows)
+        n_cols: Number of positions (heatmap columns)
+        annot_fmt: Format string for annotations
+        use_fast: Also colour the cells into an RGB image
+    
+    Returns:
+        Tuple of (annotation strings, RGB image or None)
+    """
+    values = np.frombuffer(values_bytes, dtype=np.float64).reshape(n_rows, n_cols)
+    annot = _format_annotations(values, annot_fmt)
+    annot.setflags(write=False)
+    
+    rgb = None
+    if use_fast:
+        # float32 is ample for the 256 colours and halves the data scanned
+        values = values.astype(np.float32)
+        # Scale to the data range, as seaborn does by default
+        vmin, vmax = values.min(), values.max()
+        scaled = (values - vmin) / (vmax - vmin) if vmax > vmin else np.zeros_like(values)
+        rgb = _probs_to_rgb(scaled, _HEATMAP_LUT)
+        rgb.setflags(write=False)
+    return annot, rgb
+
+
+def _draw_fast_heatmap(values: np.ndarray,
+                       annot: np.ndarray,
+                       rgb: np.ndarray,
+                       rows: tuple,
+                       cols: tuple) -> plt.Axes:
+    """
+    Draw a heatmap as a single RGB image instead of seaborn's per-cell mesh.
+    
+    Args:
+        values: Probability values of shape (n_teams, n_positions)
+        annot: Annotation strings with the same shape as values
+        rgb: Cell colours of shape (n_teams, n_positions, 3)
+        rows: Team names (heatmap rows)
+        cols: Final positions (heatmap columns)
+    
+    Returns:
+        Axes holding the heatmap
+    """
+    ax = plt.gca()
+    ax.imshow(rgb, aspect="auto", interpolation="nearest")
+    ax.set_xticks(np.arange(len(cols)), labels=list(cols))
+    ax.set_yticks(np.arange(len(rows)), labels=list(rows))
+    
+    # Light text on dark cells, dark text on light cells
+    luminance = rgb @ np.array([0.299, 0.587, 0.114])
+    text_colors = np.where(luminance < 128, "white", "black")
+    for (i, j), text in np.ndenumerate(annot):
+        ax.annotate(text, (j, i), ha="center", va="center", color=text_colors[i, j])
+    
+    plt.colorbar(
+        ScalarMappable(norm=Normalize(vmin=values.min(), vmax=values.max()), cmap=_CMAP_YLGNBU),
+        ax=ax,
+        label="Probability"
+    )
+    return ax
 
 
 def plot_team_statistics(home_stats: pd.DataFrame,
                         away_stats: Optional[pd.DataFrame] = None,
                         title: str = "Team Statistics",
-                        figsize: tuple = (14, 10)) -> None:
+                        figsize: tuple = (14, 10),
+                        show: bool = True) -> Optional[Figure]:
     """
     Create scatter plot of team statistics.
     
@@ -23,60 +382,92 @@ def plot_team_statistics(home_stats: pd.DataFrame,
         away_stats: Away team statistics DataFrame (optional)
         title: Title for the plot
         figsize: Figure size tuple (width, height)
+        show: Show the figure with plt.show() (skipped when headless);
+              otherwise return it so the caller can arrange or display
+              several figures together
+    
+    Returns:
+        The Figure when show is False, otherwise None
     """
-    plt.figure(figsize=figsize)
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    xs = home_stats["avg_home_goals_scored"].to_numpy()
+    ys = home_stats["avg_home_goals_conceded"].to_numpy()
+    names = home_stats.index.to_numpy()
     
     # Plot home team statistics
-    sns.scatterplot(
-        data=home_stats,
-        x="avg_home_goals_scored",
-        y="avg_home_goals_conceded",
-        s=100,
-        label="Home"
-    )
+    ax.scatter(xs, ys, s=100, edgecolor="white", label="Home")
     
-    # Annotate with team names
-    for idx in range(len(home_stats)):
-        team_name = home_stats.index[idx]
-        x = home_stats["avg_home_goals_scored"].iloc[idx]
-        y = home_stats["avg_home_goals_conceded"].iloc[idx]
-        plt.text(x, y, team_name, fontsize=9, ha="right")
+    # Plot away team statistics
+    if away_stats is not None:
+        ax.scatter(
+            away_stats["avg_away_goals_scored"].to_numpy(),
+            away_stats["avg_away_goals_conceded"].to_numpy(),
+            s=100,
+            edgecolor="white",
+            label="Away"
+        )
     
-    plt.title(title)
-    plt.xlabel("Average Goals Scored")
-    plt.ylabel("Average Goals Conceded")
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    # Annotate with team names, nudging apart labels of nearby teams
+    offsets = _label_offsets(np.column_stack([xs, ys]))
+    for name, x, y in zip(names, xs + offsets[:, 0], ys + offsets[:, 1]):
+        ax.text(x, y, name, fontsize=9, ha="right")
+    
+    ax.set_title(title)
+    ax.set_xlabel("Average Goals Scored")
+    ax.set_ylabel("Average Goals Conceded")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    _apply_layout(fig, "team_statistics")
+    if not show:
+        return fig
+    if _HEADLESS:
+        plt.close(fig)
+    else:
+        plt.show()
 
 
-def plot_position_probabilities_heatmap(position_probs: pd.DataFrame,
-                                      title: str = "Probability of Final League Positions",
-                                      figsize: tuple = (16, 10),
-                                      annot_fmt: str = ".2%") -> None:
+def _build_heatmap_figure(values: np.ndarray,
+                          rows: tuple,
+                          cols: tuple,
+                          title: str,
+                          figsize: tuple,
+                          annot_fmt: str,
+                          use_fast: bool) -> Figure:
     """
-    Create heatmap of position probabilities.
-    
+    Build the position probability heatmap figure.
+
     Args:
-        position_probs: DataFrame with shape (n_teams, n_positions)
-                       containing probability values
+        values: float64 probability values of shape (n_teams, n_positions)
+        rows: Team names (heatmap rows)
+        cols: Final positions (heatmap columns)
         title: Title for the heatmap
         figsize: Figure size tuple (width, height)
         annot_fmt: Format string for annotations
+        use_fast: Draw the cells as one RGB image instead of with seaborn
+
+    Returns:
+        The heatmap Figure
     """
-    plt.figure(figsize=figsize)
+    annot, rgb = _heatmap_cells(
+        values.tobytes(), len(rows), len(cols), annot_fmt, use_fast
+    )
+    # Annotations keep full precision, the colours only need float32
+    values32 = values.astype(np.float32)
+
+    fig = plt.figure(figsize=figsize)
     
     # Create heatmap
-    ax = sns.heatmap(
-        position_probs,
-        annot=True,
-        fmt=annot_fmt,
-        cmap="YlGnBu",
-        cbar_kws={"label": "Probability"},
-        linewidths=0.5,
-        linecolor="gray"
-    )
+    if use_fast:
+        ax = _draw_fast_heatmap(values32, annot, rgb, rows, cols)
+    else:
+        position_probs = pd.DataFrame(values32, index=list(rows), columns=list(cols))
+        ax = sns.heatmap(
+            position_probs,
+            annot=annot,
+            fmt="",
+            **_HEATMAP_KW
+        )
     
     plt.title(title, fontsize=16, fontweight="bold")
     plt.xlabel("Final Position", fontsize=12)
@@ -90,76 +481,295 @@ def plot_position_probabilities_heatmap(position_probs: pd.DataFrame,
     plt.xticks(rotation=0)
     plt.yticks(rotation=0)
     
-    plt.tight_layout()
-    plt.show()
+    _apply_layout(fig, "heatmap")
+    return fig
 
 
-def plot_team_position_distribution(position_probs: pd.DataFrame,
+def plot_position_probabilities_heatmap(position_probs: Union[pd.DataFrame, PlotData],
+                                      title: str = "Probability of Final League Positions",
+                                      figsize: tuple = (16, 10),
+                                      annot_fmt: str = ".2%",
+                                      use_fast: bool = False,
+                                      show: bool = True) -> Optional[Figure]:
+    """
+    Create heatmap of position probabilities.
+    
+    Identical tables reuse the cached cell annotations (and colours) instead
+    of formatting them again.
+    With use_fast the cells are coloured in one pass (compiled when numba is
+    installed) and drawn as a single image, which scales better to large
+    tables than seaborn's per-cell artists.
+    
+    Args:
+        position_probs: DataFrame with shape (n_teams, n_positions)
+                       containing probability values, or PlotData built
+                       from one
+        title: Title for the heatmap
+        figsize: Figure size tuple (width, height)
+        annot_fmt: Format string for annotations
+        use_fast: Draw the heatmap as an image instead of with seaborn
+        show: Show the figure with plt.show() (skipped when headless);
+              otherwise return it so the caller can arrange or display
+              several figures together
+    
+    Returns:
+        The Figure when show is False, otherwise None
+    """
+    data = _as_plot_data(position_probs)
+    
+    fig = _build_heatmap_figure(
+        data.values,
+        data.teams,
+        tuple(data.positions.tolist()),
+        title,
+        tuple(figsize),
+        annot_fmt,
+        use_fast
+    )
+    
+    if not show:
+        return fig
+    if _HEADLESS:
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def plot_team_position_distribution(position_probs: Union[pd.DataFrame, PlotData],
                                    team: str,
-                                   figsize: tuple = (12, 6)) -> None:
+                                   figsize: tuple = (12, 6),
+                                   show: bool = True) -> Optional[Figure]:
     """
     Create bar plot of position probability distribution for a single team.
     
     Args:
-        position_probs: DataFrame with position probabilities
+        position_probs: DataFrame with position probabilities, or PlotData
+                       built from one
         team: Team name
         figsize: Figure size tuple (width, height)
+        show: Show the figure with plt.show() (skipped when headless);
+              otherwise return it so the caller can arrange or display
+              several figures together
+    
+    Returns:
+        The Figure when show is False, otherwise None
     """
-    team_probs = position_probs.loc[team]
+    data = _as_plot_data(position_probs)
+    if team not in data.teams:
+        raise KeyError(team)
+    positions = data.positions
     
-    plt.figure(figsize=figsize)
-    plt.bar(team_probs.index, team_probs.values, color="steelblue", alpha=0.7)
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.bar(positions, data.values[data.teams.index(team)], color="steelblue", alpha=0.7)
     
-    plt.title(f"{team} - Final Position Probability Distribution", fontsize=14, fontweight="bold")
-    plt.xlabel("Final Position", fontsize=12)
-    plt.ylabel("Probability", fontsize=12)
-    plt.xticks(team_probs.index)
-    plt.grid(True, alpha=0.3, axis="y")
+    ax.set_title(f"{team} - Final Position Probability Distribution", fontsize=14, fontweight="bold")
+    ax.set_xlabel("Final Position", fontsize=12)
+    ax.set_ylabel("Probability", fontsize=12)
+    ax.set_xticks(positions)
+    ax.grid(True, alpha=0.3, axis="y")
     
     # Format y-axis as percentage
-    ax = plt.gca()
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: "{:0.1%}".format(y)))
+    ax.yaxis.set_major_formatter(PercentFormatter(xmax=1, decimals=1))
     
-    plt.tight_layout()
-    plt.show()
+    _apply_layout(fig, "team_distribution")
+    if not show:
+        return fig
+    if _HEADLESS:
+        plt.close(fig)
+    else:
+        plt.show()
 
 
-def plot_multiple_teams_distribution(position_probs: pd.DataFrame,
+# Figure reused across displayed plot_multiple_teams_distribution calls, with
+# the line drawn for each team so far
+_multi_team_fig: Optional[Figure] = None
+_multi_team_lines: dict = {}
+
+
+def _new_multi_team_figure(figsize: tuple) -> Figure:
+    """
+    Create an empty figure for plot_multiple_teams_distribution.
+    
+    Args:
+        figsize: Figure size tuple (width, height)
+    
+    Returns:
+        Figure with titled, labelled axes
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.set_title("Final Position Probability Distribution - Multiple Teams", 
+                 fontsize=14, fontweight="bold")
+    ax.set_xlabel("Final Position", fontsize=12)
+    ax.set_ylabel("Probability", fontsize=12)
+    ax.grid(True, alpha=0.3)
+    
+    # Format y-axis as percentage
+    ax.yaxis.set_major_formatter(PercentFormatter(xmax=1, decimals=1))
+    return fig
+
+
+def plot_multiple_teams_distribution(position_probs: Union[pd.DataFrame, PlotData],
                                     teams: list,
-                                    figsize: tuple = (14, 8)) -> None:
+                                    figsize: tuple = (14, 8),
+                                    show: bool = True) -> Optional[Figure]:
     """
     Create line plot comparing position distributions for multiple teams.
     
+    When shown, the figure is kept between calls: existing lines are updated
+    in place and lines of teams that are not requested are hidden, so only
+    teams plotted for the first time create new artists. With show=False a
+    new figure is built, so returned figures are independent of each other.
+    
     Args:
-        position_probs: DataFrame with position probabilities
+        position_probs: DataFrame with position probabilities, or PlotData
+                       built from one
         teams: List of team names to plot
         figsize: Figure size tuple (width, height)
+        show: Show the figure with plt.show() (skipped when headless);
+              otherwise return it so the caller can arrange or display
+              several figures together
+    
+    Returns:
+        The Figure when show is False, otherwise None
     """
-    plt.figure(figsize=figsize)
+    global _multi_team_fig
+    
+    if not show:
+        fig = _new_multi_team_figure(figsize)
+        lines = {}
+    elif _multi_team_fig is None or tuple(_multi_team_fig.get_size_inches()) != tuple(figsize):
+        fig = _multi_team_fig = _new_multi_team_figure(figsize)
+        lines = _multi_team_lines
+        lines.clear()
+    else:
+        # Re-register the figure with pyplot in case a previous show closed it
+        fig = plt.figure(_multi_team_fig)
+        lines = _multi_team_lines
+    ax = fig.axes[0]
+    
+    # Select the requested rows once instead of indexing per team
+    data = _as_plot_data(position_probs)
+    team_rows = {team: row for row, team in enumerate(data.teams)}
+    present = [team for team in teams if team in team_rows]
+    team_values = data.values[[team_rows[team] for team in present]]
+    positions = data.positions
     
-    for team in teams:
-        if team in position_probs.index:
-            team_probs = position_probs.loc[team]
-            plt.plot(
-                team_probs.index,
-                team_probs.values,
+    visible = []
+    for team, values in zip(present, team_values):
+        line = lines.get(team)
+        if line is None:
+            line, = ax.plot(
+                positions,
+                values,
                 marker="o",
                 label=team,
                 linewidth=2,
                 markersize=6
             )
+            lines[team] = line
+        else:
+            line.set_data(positions, values)
+        visible.append(line)
     
-    plt.title("Final Position Probability Distribution - Multiple Teams", 
-              fontsize=14, fontweight="bold")
-    plt.xlabel("Final Position", fontsize=12)
-    plt.ylabel("Probability", fontsize=12)
-    plt.xticks(position_probs.columns)
-    plt.grid(True, alpha=0.3)
-    plt.legend(loc="best")
+    for line in lines.values():
+        line.set_visible(line in visible)
     
-    # Format y-axis as percentage
-    ax = plt.gca()
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: "{:0.1%}".format(y)))
+    ax.set_xticks(positions)
+    ax.legend(handles=visible, loc="best")
+    ax.relim(visible_only=True)
+    ax.autoscale_view()
     
-    plt.tight_layout()
-    plt.show()
+    _apply_layout(fig, "multiple_teams")
+    if not show:
+        return fig
+    if _HEADLESS:
+        plt.close(fig)
+    else:
+        fig.canvas.draw_idle()
+        plt.show()
+
+
+# Background rendering: (plot_func, filepath, args, kwargs, future) jobs are
+# drawn and saved one at a time by a single daemon thread, which requires one
+# of these non-interactive backends
+_FILE_BACKENDS = {"agg", "cairo", "pdf", "pgf", "ps", "svg", "template"}
+_draw_queue: queue.Queue = queue.Queue()
+_drawer_thread: Optional[threading.Thread] = None
+_drawer_lock = threading.Lock()
+
+
+def _drawer_loop() -> None:
+    """
+    Draw queued plots and save them to file, one at a time.
+    """
+    while True:
+        plot_func, filepath, args, kwargs, future = _draw_queue.get()
+        open_figures = set(plt.get_fignums())
+        try:
+            if future.set_running_or_notify_cancel():
+                fig = plot_func(*args, show=False, **kwargs)
+                fig.savefig(filepath)
+                plt.close(fig)
+                future.set_result(filepath)
+        except Exception as exc:
+            # Close whatever the failed plot left open
+            for num in set(plt.get_fignums()) - open_figures:
+                plt.close(num)
+            future.set_exception(exc)
+        finally:
+            _draw_queue.task_done()
+
+
+def plot_async(plot_func: Callable[..., Optional[Figure]],
+               filepath: str,
+               *args,
+               **kwargs) -> Future:
+    """
+    Queue a plot to be drawn and saved to file on a background thread.
+    
+    Lets the caller carry on (e.g. with the next batch of simulations) while
+    matplotlib renders. Plots are drawn in submission order. The plot
+    functions go through pyplot, so this needs a non-interactive backend
+    such as Agg (e.g. via FOOTBALL_DS_HEADLESS=1), and other threads should
+    not plot until wait_for_plots() has returned.
+    
+    Args:
+        plot_func: One of the plot_* functions of this module
+        filepath: Path the figure is saved to
+        *args: Positional arguments for plot_func
+        **kwargs: Keyword arguments for plot_func (show is always False)
+    
+    Returns:
+        Future resolving to filepath once the figure has been saved
+    
+    Raises:
+        RuntimeError: If matplotlib uses an interactive backend (GUI, inline
+                      or widget), which cannot safely create figures off the
+                      main thread
+    """
+    global _drawer_thread
+    
+    backend = matplotlib.get_backend()
+    if backend.lower() not in _FILE_BACKENDS:
+        raise RuntimeError(
+            f"plot_async needs a non-interactive matplotlib backend such as Agg, "
+            f"not {backend!r}; set FOOTBALL_DS_HEADLESS=1 or call matplotlib.use('Agg')"
+        )
+    
+    with _drawer_lock:
+        if _drawer_thread is None:
+            _drawer_thread = threading.Thread(
+                target=_drawer_loop, name="plot-drawer", daemon=True
+            )
+            _drawer_thread.start()
+    
+    future = Future()
+    _draw_queue.put((plot_func, filepath, args, kwargs, future))
+    return future
+
+
+def wait_for_plots() -> None:
+    """
+    Block until every queued plot has been drawn and saved.
+    """
+    _draw_queue.join()